@@ -0,0 +1,42 @@
+"""In-memory cache of completed council runs keyed on the user query."""
+
+import pickle
+from hashlib import blake2b
+from typing import Any, Optional, Tuple
+
+from cachetools import TTLCache
+
+# Completed runs, stored pickled so callers can't mutate cached results
+_council_cache: TTLCache = TTLCache(maxsize=1024, ttl=3600)
+
+
+def query_key(user_query: str) -> str:
+    """Build the cache key for a user query."""
+    return blake2b(user_query.encode(), digest_size=16).hexdigest()
+
+
+def get_council_result(user_query: str) -> Optional[Tuple]:
+    """
+    Look up a previous council run for this exact query.
+
+    Args:
+        user_query: The user's question
+
+    Returns:
+        Tuple of (stage1, stage2, stage3, stage4, metadata), or None on a miss
+    """
+    cached = _council_cache.get(query_key(user_query))
+    if cached is None:
+        return None
+    return pickle.loads(cached)
+
+
+def store_council_result(user_query: str, result: Tuple[Any, ...]):
+    """
+    Cache a completed council run.
+
+    Args:
+        user_query: The user's question
+        result: Tuple of (stage1, stage2, stage3, stage4, metadata)
+    """
+    _council_cache[query_key(user_query)] = pickle.dumps(result)
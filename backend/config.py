@@ -1,5 +1,7 @@
 """Configuration for the LLM Council."""
 
+import os
+
 # Council members - dict of member configs with unique identities
 # Each member has a name, model, and optional personality/traits
 COUNCIL_MEMBERS = {
@@ -26,6 +28,9 @@ COUNCIL_MEMBERS = {
     }
 }
 
+# Reverse lookup from display name (as used in send_message) to member_id
+NAME_TO_MEMBER_ID = {config["name"]: member_id for member_id, config in COUNCIL_MEMBERS.items()}
+
 # Chairman model - synthesizes final response
 CHAIRMAN_MODEL = "qwen/qwen3-1.7b"
 
@@ -33,8 +38,22 @@ CHAIRMAN_MODEL = "qwen/qwen3-1.7b"
 # Local Qwen API endpoint
 QWEN_API_URL = "http://127.0.0.1:1234/v1/chat/completions"
 
+# Maximum in-flight requests to the local server - match its parallel slot count
+MAX_CONCURRENCY = int(os.getenv("COUNCIL_MAX_CONCURRENCY", "8"))
+
+# Seconds Stage 1 waits before dropping members that haven't finished
+STAGE1_BUDGET_S = float(os.getenv("STAGE1_BUDGET_S", "60"))
+
 # Maximum tokens for model responses
 MAX_TOKENS = 700  # Approximately one paragraph
 
+# Maximum tokens for Stage 2 turns after the first round (short follow-up messages)
+FOLLOWUP_MAX_TOKENS = 200
+
+# When every member runs the same model, collect all Stage 3 rankings in one request.
+# If the reply can't be split per member, Stage 3 falls back to one request per member,
+# so a failed attempt adds one extra (up to MAX_TOKENS * members) generation of latency.
+BATCH_STAGE3_RANKINGS = True
+
 # Data directory for conversation storage
 DATA_DIR = "data/conversations"
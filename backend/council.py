@@ -1,50 +1,167 @@
 """4-stage LLM Council orchestration."""
 
-import json
-from typing import List, Dict, Any, Tuple
-from .openrouter import query_members_parallel, query_model
-from .config import COUNCIL_MEMBERS, CHAIRMAN_MODEL
-from .tools import ToolExecutor, TOOLS
+import asyncio
+import re
+from collections import Counter, deque
+from operator import itemgetter
+from typing import List, Dict, Any, Tuple, AsyncIterator, Optional
+from .openrouter import query_members_parallel, query_model, query_model_stream, SYSTEM_PROMPTS
+from .config import COUNCIL_MEMBERS, CHAIRMAN_MODEL, NAME_TO_MEMBER_ID, MAX_TOKENS, FOLLOWUP_MAX_TOKENS, BATCH_STAGE3_RANKINGS, STAGE1_BUDGET_S
+from .tools import ToolExecutor, TOOLS, parse_tool_arguments
+from .cache import get_council_result, store_council_result
+
+# Numbered ranking entry (e.g. "1. Response A"), capturing just the label
+_RANK_RE = re.compile(r'\d+\.\s*(Response [A-Z])')
+# Any bare response label
+_RESP_RE = re.compile(r'Response [A-Z]')
+# Stage 4 response used when the chairman fails
+SYNTHESIS_FAILED_RESPONSE = "Error: Unable to generate final synthesis."
+# Sort key for aggregate rankings
+_AVERAGE_RANK = itemgetter('average_rank')
+# Section header in a batched Stage 3 response (e.g. "=== alice ===")
+_MEMBER_SECTION_RE = re.compile(r'^[ \t]*=+[ \t]*(\w+)[ \t]*=+[ \t]*$', re.MULTILINE)
+# Stage 2 replies that mean the member has nothing more to contribute
+_NO_CONTRIBUTION_RE = re.compile(r'^(no (further )?comments?|nothing (more |further )?to add)\.?$', re.IGNORECASE)
+
+
+def _build_collab_system_prompt(member_config: Dict[str, Any]) -> str:
+    """Build the Stage 2 collaboration system prompt from member configuration."""
+    traits_str = ", ".join(member_config.get("traits", []))
+    return f"""You are {member_config['name']}, a council member in a multi-model deliberation system.
 
+Role: {member_config['role']}
+Personality: {member_config['personality']}
+Traits: {traits_str}
+
+You are now in the COLLABORATION stage. You've seen everyone's initial responses to the user's question.
+Your goal is to engage with other council members to refine and improve the collective understanding.
+
+Use the send_message tool to:
+- Share insights or critiques about other members' responses
+- Ask clarifying questions
+- Build on ideas you find compelling
+- Point out potential issues or gaps
+
+Be constructive and stay in character. Limit your messages to 2-3 sentences each."""
+
+
+# Collaboration system prompts, rendered once so every call sends identical bytes
+_COLLAB_SYSTEM_PROMPTS: Dict[str, str] = {
+    member_id: _build_collab_system_prompt(member_config)
+    for member_id, member_config in COUNCIL_MEMBERS.items()
+}
+
+
+def format_stage1_text(stage1_results: List[Dict[str, Any]]) -> str:
+    """Format Stage 1 responses with member names and roles, as shown to members and the chairman."""
+    return "\n\n".join(
+        f"{result['member_name']} ({result['role']}):\n{result['response']}"
+        for result in stage1_results
+    )
 
-async def stage1_collect_responses(user_query: str) -> List[Dict[str, Any]]:
+
+async def stage1_stream_responses(user_query: str) -> AsyncIterator[Dict[str, Any]]:
     """
-    Stage 1: Collect individual responses from all council members.
+    Stage 1: Stream individual responses from all council members.
+
+    Members are queried concurrently and their output is forwarded as it is generated.
+    Members still running after STAGE1_BUDGET_S are cancelled, as long as one has answered.
 
     Args:
         user_query: The user's question
 
-    Returns:
-        List of dicts with 'member_id', 'member_name', 'model' and 'response' keys
+    Yields:
+        'stage1_delta' events with each chunk of a member's response, a 'stage1_item'
+        event as each member finishes ('data' is None if it failed or was dropped), and a
+        final 'stage1_complete' event with all successful results
     """
     # Instruct models to keep responses brief
     prompt = f"{user_query}\n\nIMPORTANT: Keep your response to ONE paragraph only (4 sentences). Be concise and direct."
     messages = [{"role": "user", "content": prompt}]
 
-    # Query all members in parallel
-    responses = await query_members_parallel(COUNCIL_MEMBERS, messages)
+    events = asyncio.Queue()
 
-    # Format results with member information
-    stage1_results = []
-    for member_id, response in responses.items():
-        if response is not None:
-            member_config = COUNCIL_MEMBERS[member_id]
-            content = response.get('content', '') if isinstance(response, dict) else str(response)
-            stage1_results.append({
+    async def run_member(member_id: str, member_config: Dict[str, Any]):
+        def on_delta(delta: str):
+            events.put_nowait({
+                "type": "stage1_delta",
                 "member_id": member_id,
                 "member_name": member_config['name'],
                 "model": member_config['model'],
                 "role": member_config['role'],
-                "response": content
+                "delta": delta
             })
 
-    return stage1_results
+        result = None
+        try:
+            response = await query_model_stream(
+                member_config['model'],
+                messages,
+                on_delta,
+                system_prompt=SYSTEM_PROMPTS[member_id]
+            )
+
+            if response is not None:
+                result = {
+                    "member_id": member_id,
+                    "member_name": member_config['name'],
+                    "model": member_config['model'],
+                    "role": member_config['role'],
+                    "response": response.get('content', '')
+                }
+        finally:
+            # Always report the member, even if it failed, so the stream never waits on it forever
+            events.put_nowait({"type": "stage1_item", "member_id": member_id, "data": result})
+
+    # Query all members in parallel
+    tasks = [
+        asyncio.create_task(run_member(member_id, member_config))
+        for member_id, member_config in COUNCIL_MEMBERS.items()
+    ]
+
+    # After the budget, stop waiting on slow members once at least one has answered
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + STAGE1_BUDGET_S
+
+    results = {}
+    finished = set()
+    try:
+        while len(finished) < len(tasks):
+            try:
+                if not events.empty():
+                    event = events.get_nowait()
+                else:
+                    timeout = None if not results else max(deadline - loop.time(), 0)
+                    event = await asyncio.wait_for(events.get(), timeout=timeout)
+            except asyncio.TimeoutError:
+                dropped = [member_id for member_id in COUNCIL_MEMBERS if member_id not in finished]
+                print(f"Stage 1 budget of {STAGE1_BUDGET_S}s exceeded, continuing without {len(dropped)} member(s)")
+
+                # Tell the client to discard any partial text from dropped members
+                for member_id in dropped:
+                    yield {"type": "stage1_item", "member_id": member_id, "data": None}
+                break
+
+            if event['type'] == 'stage1_item':
+                finished.add(event['member_id'])
+                if event['data'] is not None:
+                    results[event['member_id']] = event['data']
+            yield event
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    # Keep council order so anonymized labels are stable regardless of finish order
+    stage1_results = [results[member_id] for member_id in COUNCIL_MEMBERS if member_id in results]
+
+    yield {"type": "stage1_complete", "data": stage1_results}
 
 
 async def stage2_collaboration(
     user_query: str,
     stage1_results: List[Dict[str, Any]],
-    max_rounds: int = 2
+    max_rounds: int = 2,
+    stage1_text: Optional[str] = None
 ) -> List[Dict[str, Any]]:
     """
     Stage 2: Council members collaborate through message passing.
@@ -55,44 +172,25 @@ async def stage2_collaboration(
         user_query: The original user query
         stage1_results: Results from Stage 1
         max_rounds: Maximum number of collaboration rounds
+        stage1_text: Pre-formatted Stage 1 responses (built from stage1_results if omitted)
         
     Returns:
         List of collaboration exchanges with member messages and tool calls
     """
     from .openrouter import query_model
     
-    message_queue = []
+    message_queue = deque()
     tool_executor = ToolExecutor(message_queue)
     collaboration_log = []
     
-    # Build system prompt for collaboration
-    def build_collab_system_prompt(member_config: Dict[str, Any]) -> str:
-        traits_str = ", ".join(member_config.get("traits", []))
-        return f"""You are {member_config['name']}, a council member in a multi-model deliberation system.
-
-Role: {member_config['role']}
-Personality: {member_config['personality']}
-Traits: {traits_str}
-
-You are now in the COLLABORATION stage. You've seen everyone's initial responses to the user's question.
-Your goal is to engage with other council members to refine and improve the collective understanding.
-
-Use the send_message tool to:
-- Share insights or critiques about other members' responses
-- Ask clarifying questions
-- Build on ideas you find compelling
-- Point out potential issues or gaps
-
-Be constructive and stay in character. Limit your messages to 2-3 sentences each."""
+    # Members whose last turn was empty or a no-op
+    idle_members = set()
     
     # Track conversation history for each member
     member_histories = {member_id: [] for member_id in COUNCIL_MEMBERS.keys()}
     
     # Show each member all the Stage 1 responses
-    all_responses_text = "\n\n".join([
-        f"{result['member_name']} ({result['role']}):\n{result['response']}"
-        for result in stage1_results
-    ])
+    all_responses_text = stage1_text if stage1_text is not None else format_stage1_text(stage1_results)
     
     initial_context = f"""Original Question: {user_query}
 
@@ -103,30 +201,42 @@ Here are all the initial responses from the council:
 Review these responses and decide if you want to engage with other council members. You can use the send_message tool to communicate with them."""
     
     for round_num in range(max_rounds):
-        # Each member gets a chance to send messages
-        for member_id, member_config in COUNCIL_MEMBERS.items():
-            system_prompt = build_collab_system_prompt(member_config)
-            
-            # Build messages for this member
-            if round_num == 0:
-                # First round: present the initial responses
-                messages = [{"role": "user", "content": initial_context}]
-            else:
-                # Subsequent rounds: continue the conversation
-                messages = [{"role": "user", "content": "Continue the discussion if you have more to contribute."}]
-            
-            # Add any messages this member received
-            if member_histories[member_id]:
-                messages.extend(member_histories[member_id])
-            
-            # Query the model with tools
-            response = await query_model(
+        if round_num == 0:
+            # First round: present the initial responses
+            opening_message = {"role": "user", "content": initial_context}
+        else:
+            # Subsequent rounds: continue the conversation
+            opening_message = {"role": "user", "content": "Continue the discussion if you have more to contribute."}
+
+        # Members who had nothing to add sit out the remaining rounds
+        active_members = {
+            member_id: member_config
+            for member_id, member_config in COUNCIL_MEMBERS.items()
+            if member_id not in idle_members
+        }
+        if not active_members:
+            break
+
+        # Build messages for every member from the same snapshot of histories
+        member_messages = {
+            member_id: [opening_message] + member_histories[member_id]
+            for member_id in active_members
+        }
+
+        # Each member gets a chance to send messages - turns within a round are independent
+        responses = await asyncio.gather(*[
+            query_model(
                 member_config['model'],
-                messages,
-                system_prompt=system_prompt,
-                tools=TOOLS
+                member_messages[member_id],
+                system_prompt=_COLLAB_SYSTEM_PROMPTS[member_id],
+                tools=TOOLS,
+                max_tokens=MAX_TOKENS if round_num == 0 else FOLLOWUP_MAX_TOKENS
             )
-            
+            for member_id, member_config in active_members.items()
+        ])
+
+        # Process responses in member order so logs and queued messages stay deterministic
+        for (member_id, member_config), response in zip(active_members.items(), responses):
             if response is None:
                 continue
             
@@ -141,13 +251,14 @@ Review these responses and decide if you want to engage with other council membe
             
             # Process tool calls
             tool_calls = response.get('tool_calls', [])
+            content = (response.get('content') or '').strip()
+            if not tool_calls and (not content or _NO_CONTRIBUTION_RE.match(content)):
+                idle_members.add(member_id)
+
             if tool_calls:
                 for tool_call in tool_calls:
                     tool_name = tool_call['function']['name']
-                    try:
-                        args = json.loads(tool_call['function']['arguments'])
-                    except json.JSONDecodeError:
-                        args = {}
+                    args = parse_tool_arguments(tool_call['function'].get('arguments'))
                     
                     # Execute the tool
                     result = tool_executor.execute(member_config['name'], tool_name, args)
@@ -175,16 +286,13 @@ Review these responses and decide if you want to engage with other council membe
         
         # Deliver messages from the queue
         while message_queue:
-            msg = message_queue.pop(0)
-            recipient_id = None
-            
-            # Find the recipient's member_id
-            for mid, mconfig in COUNCIL_MEMBERS.items():
-                if mconfig['name'] == msg['to']:
-                    recipient_id = mid
-                    break
+            msg = message_queue.popleft()
+            recipient_id = NAME_TO_MEMBER_ID.get(msg['to'])
             
             if recipient_id:
+                # A new message gives an idle member something to respond to
+                idle_members.discard(recipient_id)
+
                 # Add message to recipient's history
                 member_histories[recipient_id].append({
                     "role": "user",
@@ -229,10 +337,10 @@ async def stage3_collect_rankings(
     }
 
     # Build the ranking prompt with initial responses
-    responses_text = "\n\n".join([
+    responses_text = "\n\n".join(
         f"Response {label}:\n{result['response']}"
         for label, result in zip(labels, stage1_results)
-    ])
+    )
 
     # Build collaboration summary (anonymized)
     collaboration_text = ""
@@ -250,19 +358,17 @@ async def stage3_collect_rankings(
         if collab_messages:
             collaboration_text = "\n\nCollaboration Exchanges:\n" + "\n".join(collab_messages)
 
-    # Build the ranking prompt
-    responses_text = "\n\n".join([
-        f"Response {label}:\n{result['response']}"
-        for label, result in zip(labels, stage1_results)
-    ])
-
-    ranking_prompt = f"""You are evaluating different responses to the following question:
+    # Question and responses, shared by the per-member and batched ranking prompts
+    ranking_context = f"""You are evaluating different responses to the following question:
 
 Question: {user_query}
 
 Here are the responses from different models (anonymized):
 
-{responses_text}{collaboration_text}
+{responses_text}{collaboration_text}"""
+
+    # Build the ranking prompt - identical bytes for every grader so the server can reuse the prefix
+    ranking_prompt = f"""{ranking_context}
 
 Your task:
 1. First, evaluate each response individually. Consider both the initial response AND their engagement in collaboration (if any).
@@ -292,8 +398,14 @@ Now provide your evaluation and ranking:"""
 
     messages = [{"role": "user", "content": ranking_prompt}]
 
+    # Members sharing one model can all rank in a single request
+    responses = None
+    if BATCH_STAGE3_RANKINGS and len({config['model'] for config in COUNCIL_MEMBERS.values()}) == 1:
+        responses = await collect_rankings_batched(ranking_context)
+
     # Get rankings from all council members in parallel
-    responses = await query_members_parallel(COUNCIL_MEMBERS, messages)
+    if responses is None:
+        responses = await query_members_parallel(COUNCIL_MEMBERS, messages)
 
     # Format results with member information
     stage3_results = []
@@ -313,11 +425,81 @@ Now provide your evaluation and ranking:"""
     return stage3_results, label_to_member
 
 
+async def collect_rankings_batched(ranking_context: str) -> Optional[Dict[str, Dict[str, Any]]]:
+    """
+    Ask one model to write every member's evaluation in a single response.
+
+    Each evaluation comes back in its own "=== member_id ===" section. If the request
+    fails or a section is missing, the caller falls back to per-member queries, so a
+    failed attempt costs one extra generation before the normal Stage 3 calls.
+
+    Args:
+        ranking_context: The question and anonymized responses shared by all members
+
+    Returns:
+        Dict mapping member_id to a response dict with 'content', or None if the
+        request failed or the output couldn't be split per member
+    """
+    personas_text = "\n".join(
+        f"- {member_id}: {config['name']}, {config['role']}. "
+        f"Personality: {config['personality']}. Traits: {', '.join(config.get('traits', []))}"
+        for member_id, config in COUNCIL_MEMBERS.items()
+    )
+    example_text = "\n\n".join(
+        f"""=== {member_id} ===
+Response A provides good detail on X but misses Y...
+Response B is accurate but lacks depth on Z...
+
+FINAL RANKING:
+1. Response B
+2. Response A"""
+        for member_id in COUNCIL_MEMBERS
+    )
+
+    batched_prompt = f"""{ranking_context}
+
+Your task: write a separate evaluation for EACH of the following council members, in that member's voice:
+
+{personas_text}
+
+For each member:
+1. Evaluate each response individually, considering both the initial response AND its engagement in collaboration (if any). Use ONE brief paragraph per response (2-3 sentences).
+2. End with that member's final ranking: the line "FINAL RANKING:" (all caps, with colon), then the responses from best to worst as a numbered list (e.g., "1. Response A"), with no other text.
+
+Start each member's section with a line containing only their id between === markers, exactly as shown.
+
+Example of the correct format for your ENTIRE response:
+
+{example_text}
+
+Now provide the evaluations and rankings:"""
+
+    messages = [{"role": "user", "content": batched_prompt}]
+    model = next(iter(COUNCIL_MEMBERS.values()))['model']
+    response = await query_model(model, messages, max_tokens=MAX_TOKENS * len(COUNCIL_MEMBERS))
+
+    if response is None:
+        return None
+
+    # split() with a capturing group alternates [preamble, id, section, id, section, ...]
+    parts = _MEMBER_SECTION_RE.split(response.get('content') or '')
+    evaluations = {
+        member_id.lower(): section.strip()
+        for member_id, section in zip(parts[1::2], parts[2::2])
+    }
+
+    if not all(evaluations.get(member_id) for member_id in COUNCIL_MEMBERS):
+        return None
+
+    return {member_id: {'content': evaluations[member_id]} for member_id in COUNCIL_MEMBERS}
+
+
 async def stage4_synthesize_final(
     user_query: str,
     stage1_results: List[Dict[str, Any]],
     stage2_results: List[Dict[str, Any]],
-    stage3_results: List[Dict[str, Any]]
+    stage3_results: List[Dict[str, Any]],
+    stage1_text: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Stage 4: Chairman synthesizes final response.
@@ -327,33 +509,29 @@ async def stage4_synthesize_final(
         stage1_results: Individual member responses from Stage 1
         stage2_results: Collaboration exchanges from Stage 2
         stage3_results: Rankings from Stage 3
+        stage1_text: Pre-formatted Stage 1 responses (built from stage1_results if omitted)
 
     Returns:
         Dict with 'model' and 'response' keys
     """
     # Build comprehensive context for chairman
-    stage1_text = "\n\n".join([
-        f"{result['member_name']} ({result['role']}):\n{result['response']}"
-        for result in stage1_results
-    ])
+    if stage1_text is None:
+        stage1_text = format_stage1_text(stage1_results)
     
     # Build Stage 2 collaboration summary
-    stage2_text = ""
-    if stage2_results:
-        stage2_messages = []
-        for entry in stage2_results:
-            if entry.get('type') == 'message_delivery':
-                stage2_messages.append(f"{entry['from']} → {entry['to']}: {entry['message']}")
-            elif entry.get('content'):
-                stage2_messages.append(f"{entry['member_name']}: {entry['content']}")
-        
-        if stage2_messages:
-            stage2_text = f"\n\nSTAGE 2 - Collaboration:\n" + "\n".join(stage2_messages)
+    stage2_messages = "\n".join(
+        f"{entry['from']} → {entry['to']}: {entry['message']}"
+        if entry.get('type') == 'message_delivery'
+        else f"{entry['member_name']}: {entry['content']}"
+        for entry in stage2_results
+        if entry.get('type') == 'message_delivery' or entry.get('content')
+    )
+    stage2_text = f"\n\nSTAGE 2 - Collaboration:\n{stage2_messages}" if stage2_messages else ""
 
-    stage3_text = "\n\n".join([
+    stage3_text = "\n\n".join(
         f"{result['member_name']}'s Evaluation:\n{result['ranking']}"
         for result in stage3_results
-    ])
+    )
 
     chairman_prompt = f"""You are the Chairman of an LLM Council. Multiple AI models with different personalities and roles have provided responses to a user's question, collaborated through discussion, and then ranked each other's responses.
 
@@ -385,7 +563,7 @@ Provide your final answer that represents the council's collective wisdom:"""
         # Fallback if chairman fails
         return {
             "model": CHAIRMAN_MODEL,
-            "response": "Error: Unable to generate final synthesis."
+            "response": SYNTHESIS_FAILED_RESPONSE
         }
 
     return {
@@ -404,28 +582,19 @@ def parse_ranking_from_text(ranking_text: str) -> List[str]:
     Returns:
         List of response labels in ranked order
     """
-    import re
-
     # Look for "FINAL RANKING:" section
-    if "FINAL RANKING:" in ranking_text:
-        # Extract everything after "FINAL RANKING:"
-        parts = ranking_text.split("FINAL RANKING:")
-        if len(parts) >= 2:
-            ranking_section = parts[1]
-            # Try to extract numbered list format (e.g., "1. Response A")
-            # This pattern looks for: number, period, optional space, "Response X"
-            numbered_matches = re.findall(r'\d+\.\s*Response [A-Z]', ranking_section)
-            if numbered_matches:
-                # Extract just the "Response X" part
-                return [match.group() for m in numbered_matches if (match := re.search(r'Response [A-Z]', m)) is not None]
-
-            # Fallback: Extract all "Response X" patterns in order
-            matches = re.findall(r'Response [A-Z]', ranking_section)
-            return matches
+    _, found, ranking_section = ranking_text.partition("FINAL RANKING:")
+    if found:
+        # Try to extract numbered list format (e.g., "1. Response A")
+        numbered_matches = _RANK_RE.findall(ranking_section)
+        if numbered_matches:
+            return numbered_matches
+
+        # Fallback: Extract all "Response X" patterns in order
+        return _RESP_RE.findall(ranking_section)
 
     # Fallback: try to find any "Response X" patterns in order
-    matches = re.findall(r'Response [A-Z]', ranking_text)
-    return matches
+    return _RESP_RE.findall(ranking_text)
 
 
 def calculate_aggregate_rankings(
@@ -442,35 +611,34 @@ def calculate_aggregate_rankings(
     Returns:
         List of dicts with model name and average rank, sorted best to worst
     """
-    from collections import defaultdict
-
-    # Track positions for each model
-    model_positions = defaultdict(list)
+    # Running sum of positions and number of votes for each model
+    position_totals = Counter()
+    vote_counts = Counter()
 
     for ranking in stage3_results:
-        ranking_text = ranking['ranking']
-
-        # Parse the ranking from the structured format
-        parsed_ranking = parse_ranking_from_text(ranking_text)
+        # Reuse the ranking parsed in Stage 3 when available
+        parsed_ranking = ranking.get('parsed_ranking')
+        if parsed_ranking is None:
+            parsed_ranking = parse_ranking_from_text(ranking['ranking'])
 
         for position, label in enumerate(parsed_ranking, start=1):
-            if label in label_to_model:
-                model_name = label_to_model[label]
-                model_positions[model_name].append(position)
+            model_name = label_to_model.get(label)
+            if model_name is not None:
+                position_totals[model_name] += position
+                vote_counts[model_name] += 1
 
     # Calculate average position for each model
-    aggregate = []
-    for model, positions in model_positions.items():
-        if positions:
-            avg_rank = sum(positions) / len(positions)
-            aggregate.append({
-                "model": model,
-                "average_rank": round(avg_rank, 2),
-                "rankings_count": len(positions)
-            })
+    aggregate = [
+        {
+            "model": model,
+            "average_rank": round(position_totals[model] / count, 2),
+            "rankings_count": count
+        }
+        for model, count in vote_counts.items()
+    ]
 
     # Sort by average rank (lower is better)
-    aggregate.sort(key=lambda x: x['average_rank'])
+    aggregate.sort(key=_AVERAGE_RANK)
 
     return aggregate
 
@@ -513,47 +681,111 @@ Title:"""
     return title
 
 
-async def run_full_council(user_query: str) -> Tuple[List, List, List, Dict, Dict]:
+async def run_full_council(user_query: str) -> AsyncIterator[Dict[str, Any]]:
     """
-    Run the complete 4-stage council process.
+    Run the complete 4-stage council process, yielding events as it progresses.
 
     Args:
         user_query: The user's question
 
-    Returns:
-        Tuple of (stage1_results, stage2_results, stage3_results, stage4_result, metadata)
+    Yields:
+        Event dicts with a 'type' key: '<stage>_start' and '<stage>_complete' for each
+        stage (with the stage results under 'data'), plus Stage 1's 'stage1_delta' and
+        'stage1_item' events. 'stage3_complete' also carries 'metadata'.
     """
+    # Identical queries replay the previous run instead of re-querying every stage
+    cached = get_council_result(user_query)
+    if cached is not None:
+        stage1_results, stage2_results, stage3_results, stage4_result, metadata = cached
+        yield {"type": "stage1_complete", "data": stage1_results}
+        yield {"type": "stage2_complete", "data": stage2_results}
+        yield {"type": "stage3_complete", "data": stage3_results, "metadata": metadata}
+        yield {"type": "stage4_complete", "data": stage4_result}
+        return
+
     # Stage 1: Collect individual responses
-    stage1_results = await stage1_collect_responses(user_query)
+    yield {"type": "stage1_start"}
+    stage1_results = []
+    async for event in stage1_stream_responses(user_query):
+        if event['type'] == 'stage1_complete':
+            stage1_results = event['data']
+        yield event
 
     # If no models responded successfully, return error
     if not stage1_results:
-        return [], [], [], {
+        yield {"type": "stage2_complete", "data": []}
+        yield {"type": "stage3_complete", "data": [], "metadata": {}}
+        yield {"type": "stage4_complete", "data": {
             "model": "error",
             "response": "All models failed to respond. Please try again."
-        }, {}
+        }}
+        return
+
+    # Stage 1 text is shown to members in Stage 2 and to the chairman in Stage 4
+    stage1_text = format_stage1_text(stage1_results)
 
     # Stage 2: Collaboration
-    stage2_results = await stage2_collaboration(user_query, stage1_results, max_rounds=2)
+    yield {"type": "stage2_start"}
+    stage2_results = await stage2_collaboration(user_query, stage1_results, max_rounds=2, stage1_text=stage1_text)
+    yield {"type": "stage2_complete", "data": stage2_results}
 
     # Stage 3: Collect rankings
+    yield {"type": "stage3_start"}
     stage3_results, label_to_model = await stage3_collect_rankings(user_query, stage1_results, stage2_results)
 
     # Calculate aggregate rankings
     aggregate_rankings = calculate_aggregate_rankings(stage3_results, label_to_model)
 
+    metadata = {
+        "label_to_model": label_to_model,
+        "aggregate_rankings": aggregate_rankings
+    }
+    yield {"type": "stage3_complete", "data": stage3_results, "metadata": metadata}
+
     # Stage 4: Synthesize final answer
+    yield {"type": "stage4_start"}
     stage4_result = await stage4_synthesize_final(
         user_query,
         stage1_results,
         stage2_results,
-        stage3_results
+        stage3_results,
+        stage1_text=stage1_text
     )
+    yield {"type": "stage4_complete", "data": stage4_result}
+
+    # Only cache complete runs so a transient failure isn't replayed until the TTL expires
+    run_complete = (
+        len(stage1_results) == len(COUNCIL_MEMBERS)
+        and stage3_results
+        and stage4_result['model'] != "error"
+        and stage4_result['response'] != SYNTHESIS_FAILED_RESPONSE
+    )
+    if run_complete:
+        store_council_result(user_query, (stage1_results, stage2_results, stage3_results, stage4_result, metadata))
 
-    # Prepare metadata
-    metadata = {
-        "label_to_model": label_to_model,
-        "aggregate_rankings": aggregate_rankings
-    }
 
-    return stage1_results, stage2_results, stage3_results, stage4_result, metadata
+async def collect_full_council(user_query: str) -> Tuple[List, List, List, Dict, Dict]:
+    """
+    Run the complete 4-stage council process and wait for the final result.
+
+    Args:
+        user_query: The user's question
+
+    Returns:
+        Tuple of (stage1_results, stage2_results, stage3_results, stage4_result, metadata)
+    """
+    results = {}
+    metadata = {}
+    async for event in run_full_council(user_query):
+        if event['type'].endswith('_complete'):
+            results[event['type']] = event['data']
+            if 'metadata' in event:
+                metadata = event['metadata']
+
+    return (
+        results['stage1_complete'],
+        results['stage2_complete'],
+        results['stage3_complete'],
+        results['stage4_complete'],
+        metadata
+    )
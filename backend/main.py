@@ -8,11 +8,22 @@ from typing import List, Dict, Any
 import uuid
 import json
 import asyncio
+from contextlib import asynccontextmanager
 
 from . import storage
-from .council import run_full_council, generate_conversation_title, stage1_collect_responses, stage2_collaboration, stage3_collect_rankings, stage4_synthesize_final, calculate_aggregate_rankings
+from .openrouter import get_client, close_client
+from .council import run_full_council, collect_full_council, generate_conversation_title
 
-app = FastAPI(title="LLM Council API")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the shared LLM client on startup and close it on shutdown."""
+    get_client()
+    yield
+    await close_client()
+
+
+app = FastAPI(title="LLM Council API", lifespan=lifespan)
 
 # Enable CORS for local development
 app.add_middleware(
@@ -96,15 +107,24 @@ async def send_message(conversation_id: str, request: SendMessageRequest):
     # Add user message
     storage.add_user_message(conversation_id, request.content)
 
-    # If this is the first message, generate a title
+    # If this is the first message, generate a title alongside the council run
+    title_task = None
     if is_first_message:
-        title = await generate_conversation_title(request.content)
-        storage.update_conversation_title(conversation_id, title)
-
-    # Run the 4-stage council process
-    stage1_results, stage2_results, stage3_results, stage4_result, metadata = await run_full_council(
-        request.content
-    )
+        title_task = asyncio.create_task(generate_conversation_title(request.content))
+
+    try:
+        # Run the 4-stage council process
+        stage1_results, stage2_results, stage3_results, stage4_result, metadata = await collect_full_council(
+            request.content
+        )
+
+        if title_task:
+            title = await title_task
+            storage.update_conversation_title(conversation_id, title)
+    finally:
+        # Don't leave the title request running if the council run failed
+        if title_task and not title_task.done():
+            title_task.cancel()
 
     # Add assistant message with all stages
     storage.add_assistant_message(
@@ -140,35 +160,21 @@ async def send_message_stream(conversation_id: str, request: SendMessageRequest)
     is_first_message = len(conversation["messages"]) == 0
 
     async def event_generator():
+        title_task = None
         try:
             # Add user message
             storage.add_user_message(conversation_id, request.content)
 
             # Start title generation in parallel (don't await yet)
-            title_task = None
             if is_first_message:
                 title_task = asyncio.create_task(generate_conversation_title(request.content))
 
-            # Stage 1: Collect responses
-            yield f"data: {json.dumps({'type': 'stage1_start'})}\n\n"
-            stage1_results = await stage1_collect_responses(request.content)
-            yield f"data: {json.dumps({'type': 'stage1_complete', 'data': stage1_results})}\n\n"
-
-            # Stage 2: Collaboration
-            yield f"data: {json.dumps({'type': 'stage2_start'})}\n\n"
-            stage2_results = await stage2_collaboration(request.content, stage1_results, max_rounds=2)
-            yield f"data: {json.dumps({'type': 'stage2_complete', 'data': stage2_results})}\n\n"
-
-            # Stage 3: Collect rankings
-            yield f"data: {json.dumps({'type': 'stage3_start'})}\n\n"
-            stage3_results, label_to_model = await stage3_collect_rankings(request.content, stage1_results, stage2_results)
-            aggregate_rankings = calculate_aggregate_rankings(stage3_results, label_to_model)
-            yield f"data: {json.dumps({'type': 'stage3_complete', 'data': stage3_results, 'metadata': {'label_to_model': label_to_model, 'aggregate_rankings': aggregate_rankings}})}\n\n"
-
-            # Stage 4: Synthesize final answer
-            yield f"data: {json.dumps({'type': 'stage4_start'})}\n\n"
-            stage4_result = await stage4_synthesize_final(request.content, stage1_results, stage2_results, stage3_results)
-            yield f"data: {json.dumps({'type': 'stage4_complete', 'data': stage4_result})}\n\n"
+            # Stream each council event as it happens
+            results = {}
+            async for event in run_full_council(request.content):
+                if event['type'].endswith('_complete'):
+                    results[event['type']] = event['data']
+                yield f"data: {json.dumps(event)}\n\n"
 
             # Wait for title generation if it was started
             if title_task:
@@ -179,10 +185,10 @@ async def send_message_stream(conversation_id: str, request: SendMessageRequest)
             # Save complete assistant message
             storage.add_assistant_message(
                 conversation_id,
-                stage1_results,
-                stage2_results,
-                stage3_results,
-                stage4_result
+                results['stage1_complete'],
+                results['stage2_complete'],
+                results['stage3_complete'],
+                results['stage4_complete']
             )
 
             # Send completion event
@@ -191,6 +197,10 @@ async def send_message_stream(conversation_id: str, request: SendMessageRequest)
         except Exception as e:
             # Send error event
             yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+        finally:
+            # Don't leave the title request running if the run failed or the client disconnected
+            if title_task and not title_task.done():
+                title_task.cancel()
 
     return StreamingResponse(
         event_generator(),
@@ -1,8 +1,63 @@
 """Local Qwen client for making LLM requests."""
 
+import asyncio
 import httpx
-from typing import List, Dict, Any, Optional
-from .config import QWEN_API_URL, MAX_TOKENS
+import orjson
+from typing import List, Dict, Any, Optional, Callable
+from .config import COUNCIL_MEMBERS, QWEN_API_URL, MAX_TOKENS, MAX_CONCURRENCY
+
+# Seconds to wait for a connection - a down local server should fail fast
+CONNECT_TIMEOUT = 5.0
+
+# Shared client so every council query reuses pooled keep-alive connections
+_client: Optional[httpx.AsyncClient] = None
+
+# Caps concurrent requests so the server isn't handed more than it can batch
+_SEM = asyncio.Semaphore(MAX_CONCURRENCY)
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(120.0, connect=CONNECT_TIMEOUT),
+            limits=httpx.Limits(
+                max_connections=64,
+                max_keepalive_connections=32,
+                keepalive_expiry=60,
+            ),
+            # The local server speaks plain HTTP/1.1; skip any HTTP/2 negotiation
+            http2=False,
+        )
+    return _client
+
+
+async def close_client():
+    """Close the shared HTTP client if it was created."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def build_system_prompt(member_config: Dict[str, Any]) -> str:
+    """Build system prompt from member configuration."""
+    traits_str = ", ".join(member_config.get("traits", []))
+    return f"""You are {member_config['name']}, a council member in a multi-model deliberation system.
+
+Role: {member_config['role']}
+Personality: {member_config['personality']}
+Traits: {traits_str}
+
+You collaborate with other models to answer questions. Stay in character and leverage your unique perspective."""
+
+
+# Member system prompts, rendered once so every call sends identical bytes
+SYSTEM_PROMPTS: Dict[str, str] = {
+    member_id: build_system_prompt(member_config)
+    for member_id, member_config in COUNCIL_MEMBERS.items()
+}
 
 
 async def query_model(
@@ -10,7 +65,8 @@ async def query_model(
     messages: List[Dict[str, str]],
     timeout: float = 120.0,
     system_prompt: Optional[str] = None,
-    tools: Optional[List[Dict[str, Any]]] = None
+    tools: Optional[List[Dict[str, Any]]] = None,
+    max_tokens: int = MAX_TOKENS
 ) -> Optional[Dict[str, Any]]:
     """
     Query a single model via local Qwen API.
@@ -21,6 +77,7 @@ async def query_model(
         timeout: Request timeout in seconds
         system_prompt: Optional system prompt to prepend
         tools: Optional list of tool definitions for function calling
+        max_tokens: Maximum tokens to generate
 
     Returns:
         Response dict with 'content', optional 'reasoning_details', and optional 'tool_calls', or None if failed
@@ -38,7 +95,7 @@ async def query_model(
     payload = {
         "model": model,
         "messages": final_messages,
-        "max_tokens": MAX_TOKENS,
+        "max_tokens": max_tokens,
     }
     
     # Add tools if provided
@@ -46,27 +103,106 @@ async def query_model(
         payload["tools"] = tools
 
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post(
+        async with _SEM:
+            response = await get_client().post(
                 QWEN_API_URL,
                 headers=headers,
-                json=payload
+                content=orjson.dumps(payload),
+                timeout=httpx.Timeout(timeout, connect=CONNECT_TIMEOUT)
             )
-            response.raise_for_status()
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        print(f"Error querying model {model}: {e}")
+        return None
 
-            data = response.json()
-            message = data['choices'][0]['message']
+    try:
+        data = orjson.loads(response.content)
+        message = data['choices'][0]['message']
 
-            return {
-                'content': message.get('content'),
-                'reasoning_details': message.get('reasoning_details'),
-                'tool_calls': message.get('tool_calls', [])
-            }
+        return {
+            'content': message.get('content'),
+            'reasoning_details': message.get('reasoning_details'),
+            'tool_calls': message.get('tool_calls', [])
+        }
 
-    except Exception as e:
-        print(f"Error querying model {model}: {e}")
+    except (ValueError, KeyError, IndexError, TypeError, AttributeError) as e:
+        print(f"Unexpected response from model {model}: {e}")
+        return None
+
+
+async def query_model_stream(
+    model: str,
+    messages: List[Dict[str, str]],
+    on_delta: Callable[[str], None],
+    timeout: float = 120.0,
+    system_prompt: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Query a single model with streaming, reporting content deltas as they arrive.
+
+    Args:
+        model: Model identifier (e.g., "qwen/qwen3-1.7b")
+        messages: List of message dicts with 'role' and 'content'
+        on_delta: Called with each chunk of generated content
+        timeout: Request timeout in seconds
+        system_prompt: Optional system prompt to prepend
+
+    Returns:
+        Response dict with the full 'content', or None if failed
+    """
+    final_messages = messages
+    if system_prompt:
+        final_messages = [{"role": "system", "content": system_prompt}] + messages
+
+    payload = {
+        "model": model,
+        "messages": final_messages,
+        "max_tokens": MAX_TOKENS,
+        "stream": True,
+    }
+
+    try:
+        async with _SEM:
+            async with get_client().stream(
+                "POST",
+                QWEN_API_URL,
+                headers={"Content-Type": "application/json"},
+                content=orjson.dumps(payload),
+                timeout=httpx.Timeout(timeout, connect=CONNECT_TIMEOUT)
+            ) as response:
+                response.raise_for_status()
+
+                parts = []
+                async for line in response.aiter_lines():
+                    # Server-sent events: "data: {chunk}" lines, terminated by "data: [DONE]"
+                    if not line.startswith("data: "):
+                        continue
+                    data = line[6:]
+                    if data == "[DONE]":
+                        break
+
+                    try:
+                        choices = orjson.loads(data).get('choices')
+                        if not choices:
+                            continue
+                        delta = (choices[0].get('delta') or {}).get('content')
+                    except (ValueError, KeyError, IndexError, TypeError, AttributeError) as e:
+                        print(f"Unexpected stream chunk from model {model}: {e}")
+                        return None
+
+                    if delta:
+                        parts.append(delta)
+                        on_delta(delta)
+    except httpx.HTTPError as e:
+        print(f"Error streaming model {model}: {e}")
         return None
 
+    return {
+        'content': "".join(parts),
+        'reasoning_details': None,
+        'tool_calls': []
+    }
+
 
 async def query_members_parallel(
     members: Dict[str, Dict[str, Any]],
@@ -82,25 +218,11 @@ async def query_members_parallel(
     Returns:
         Dict mapping member_id to response dict (or None if failed)
     """
-    import asyncio
-
-    # Build system prompts for each member
-    def build_system_prompt(member_config: Dict[str, Any]) -> str:
-        """Build system prompt from member configuration."""
-        traits_str = ", ".join(member_config.get("traits", []))
-        return f"""You are {member_config['name']}, a council member in a multi-model deliberation system.
-
-Role: {member_config['role']}
-Personality: {member_config['personality']}
-Traits: {traits_str}
-
-You collaborate with other models to answer questions. Stay in character and leverage your unique perspective."""
-
     # Create tasks for all members with their system prompts
     tasks = []
     member_ids = []
     for member_id, member_config in members.items():
-        system_prompt = build_system_prompt(member_config)
+        system_prompt = SYSTEM_PROMPTS.get(member_id) or build_system_prompt(member_config)
         task = query_model(member_config['model'], messages, system_prompt=system_prompt)
         tasks.append(task)
         member_ids.append(member_id)
@@ -1,13 +1,40 @@
 """Tool execution for council member interactions."""
 
 import json
-from typing import Dict, Any, List
+from collections import deque
+from typing import Dict, Any, TypedDict
+
+import orjson
+
+
+class SendMessageArgs(TypedDict):
+    """Arguments for the send_message tool."""
+    to_member: str
+    message: str
+
+
+def parse_tool_arguments(raw: Any) -> Dict[str, Any]:
+    """
+    Normalize tool call arguments to a dict.
+
+    Some servers return arguments already decoded, others as a JSON string.
+    Missing or malformed arguments become an empty dict.
+    """
+    if isinstance(raw, dict):
+        return raw
+    if not raw:
+        return {}
+    try:
+        args = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return {}
+    return args if isinstance(args, dict) else {}
 
 
 class ToolExecutor:
     """Executes tools called by council members."""
     
-    def __init__(self, message_queue: List):
+    def __init__(self, message_queue: deque):
         self.message_queue = message_queue
     
     def execute(self, member_name: str, tool_name: str, arguments: Dict[str, Any]) -> str:
@@ -20,7 +47,7 @@ class ToolExecutor:
         except Exception as e:
             return json.dumps({"error": f"Tool execution failed: {str(e)}"})
     
-    def _send_message(self, from_member: str, args: Dict) -> str:
+    def _send_message(self, from_member: str, args: SendMessageArgs) -> str:
         """Send message to another council member."""
         to_member = args.get("to_member")
         message = args.get("message")
@@ -103,6 +103,50 @@ function App() {
             });
             break;
 
+          case 'stage1_delta':
+            setCurrentConversation((prev) => {
+              const messages = [...prev.messages];
+              const lastMsg = messages[messages.length - 1];
+              const responses = [...(lastMsg.stage1 || [])];
+              const index = responses.findIndex((r) => r.member_id === event.member_id);
+              if (index === -1) {
+                responses.push({
+                  member_id: event.member_id,
+                  member_name: event.member_name,
+                  model: event.model,
+                  role: event.role,
+                  response: event.delta,
+                });
+              } else {
+                responses[index] = {
+                  ...responses[index],
+                  response: responses[index].response + event.delta,
+                };
+              }
+              lastMsg.stage1 = responses;
+              return { ...prev, messages };
+            });
+            break;
+
+          case 'stage1_item':
+            setCurrentConversation((prev) => {
+              const messages = [...prev.messages];
+              const lastMsg = messages[messages.length - 1];
+              const responses = [...(lastMsg.stage1 || [])];
+              const index = responses.findIndex((r) => r.member_id === event.member_id);
+              if (event.data === null) {
+                // Member failed or was dropped - discard any partial text it streamed
+                if (index !== -1) responses.splice(index, 1);
+              } else if (index === -1) {
+                responses.push(event.data);
+              } else {
+                responses[index] = event.data;
+              }
+              lastMsg.stage1 = responses;
+              return { ...prev, messages };
+            });
+            break;
+
           case 'stage1_complete':
             setCurrentConversation((prev) => {
               const messages = [...prev.messages];
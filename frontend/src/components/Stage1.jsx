@@ -2,13 +2,20 @@ import { useState } from 'react';
 import ReactMarkdown from 'react-markdown';
 import './Stage1.css';
 
+// Streamed tabs arrive out of council order and can be dropped, so track the
+// selected tab by member rather than by position
+const tabKey = (resp, index) => resp.member_id ?? index;
+
 export default function Stage1({ responses }) {
-  const [activeTab, setActiveTab] = useState(0);
+  const [activeKey, setActiveKey] = useState(0);
 
   if (!responses || responses.length === 0) {
     return null;
   }
 
+  const activeIndex = responses.findIndex((resp, index) => tabKey(resp, index) === activeKey);
+  const activeTab = activeIndex === -1 ? 0 : activeIndex;
+
   return (
     <div className="stage stage1">
       <h3 className="stage-title">Stage 1: Individual Responses</h3>
@@ -16,9 +23,9 @@ export default function Stage1({ responses }) {
       <div className="tabs">
         {responses.map((resp, index) => (
           <button
-            key={index}
+            key={tabKey(resp, index)}
             className={`tab ${activeTab === index ? 'active' : ''}`}
-            onClick={() => setActiveTab(index)}
+            onClick={() => setActiveKey(tabKey(resp, index))}
           >
             {resp.member_name || resp.member || (resp.model && (resp.model.split('/')[1] || resp.model))}
           </button>